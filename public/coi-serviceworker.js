@@ -0,0 +1,24 @@
+/* eslint-disable no-restricted-globals */
+// Cross-origin isolation shim for static hosts that cannot send custom headers
+// (GitHub Pages). It re-serves every response with the COOP/COEP headers that
+// expose SharedArrayBuffer to the page, so the scout worker pool can start.
+// Registered from index.html; src/setupProxy.js does the same for npm start.
+self.addEventListener('install', () => self.skipWaiting());
+self.addEventListener('activate', event => event.waitUntil(self.clients.claim()));
+
+self.addEventListener('fetch', event => {
+    const { request } = event;
+    // fetch() rejects these outside same-origin mode; let the browser handle them
+    if (request.cache === 'only-if-cached' && request.mode !== 'same-origin') return;
+    
+    event.respondWith(fetch(request).then(response => {
+        // Opaque responses cannot be rewritten
+        if (response.status === 0) return response;
+        
+        const headers = new Headers(response.headers);
+        headers.set('Cross-Origin-Opener-Policy', 'same-origin');
+        headers.set('Cross-Origin-Embedder-Policy', 'require-corp');
+        headers.set('Cross-Origin-Resource-Policy', 'cross-origin');
+        return new Response(response.body, { status: response.status, statusText: response.statusText, headers });
+    }));
+});
@@ -1,9 +1,29 @@
 import React, { useState, useEffect, useRef, useCallback } from 'react';
 import { Brain, Play, Pause, RotateCcw, Download, Video, Layers, Zap, Eye } from 'lucide-react';
+import { ACTIVATION_SCALE, ATTRACTOR_SCALE, PARAM_SCALE, allocTypedArray, canShareMemory, scatterActivations, updateScouts } from './scoutKernels';
 
 const FIELD_SIZE = 256;
 const MAX_SCOUTS = 8000; // Massively parallel like V1!
 const ATTRACTOR_TYPES = 12; // Many different minimodel types
+const MAX_SCOUT_WORKERS = 8;
+
+// Display gains mapping feature values to 0-255 channel intensities (255 * gain).
+// Edge strength is the L1 Sobel norm |gx| + |gy|, which runs up to sqrt(2)
+// above the Euclidean magnitude, so its gain is scaled down to match (the edge
+// scouts' gradient gain gets the same correction, see scoutKernels.js).
+const EDGE_DISPLAY_SCALE = 255 * 2 * Math.SQRT1_2;
+const MOTION_DISPLAY_SCALE = 255 * 10;
+const TEXTURE_DISPLAY_SCALE = 255 * 5;
+const ATTRACTOR_DISPLAY_SCALE = 255 * 10;
+
+// Rec. 601 luminance weights with the byte -> [0, 1] scaling folded in
+const LUMA_R = 0.299 / 255;
+const LUMA_G = 0.587 / 255;
+const LUMA_B = 0.114 / 255;
+
+// Milliseconds between stats re-renders (~5 Hz). Time-based because the loop
+// runs at the camera's frame rate, which varies between devices.
+const STATS_INTERVAL = 200;
 
 // Scout Types - Each is a "minimodel" like V1 neurons
 const SCOUT_TYPES = {
@@ -36,310 +56,629 @@ const SCOUT_COLORS = {
     [SCOUT_TYPES.TEXTURE_LOW]: '#8800ff'
 };
 
+// SCOUT_COLORS as packed 0x00BBGGRR words (canvas pixel layout on little-endian hosts)
+const SCOUT_COLORS_PACKED = Uint32Array.from(Object.values(SCOUT_TYPES), type => {
+    const rgb = parseInt(SCOUT_COLORS[type].slice(1), 16);
+    return ((rgb & 0xFF) << 16) | (rgb & 0xFF00) | (rgb >>> 16);
+});
+
+const FULLSCREEN_VERTEX_SHADER = `#version 300 es
+void main() {
+    // Single oversized triangle covering the whole viewport
+    vec2 p = vec2((gl_VertexID << 1) & 2, gl_VertexID & 2);
+    gl_Position = vec4(p * 2.0 - 1.0, 0.0, 1.0);
+}`;
+
+// RGBA8 camera frame -> luminance, same weights as PsiField.computeLuminance
+const LUMA_FRAGMENT_SHADER = `#version 300 es
+precision highp float;
+uniform sampler2D uFrame;
+out vec4 luma;
+
+void main() {
+    vec3 rgb = texelFetch(uFrame, ivec2(gl_FragCoord.xy), 0).rgb;
+    luma = vec4(dot(rgb, vec3(0.299, 0.587, 0.114)), 0.0, 0.0, 1.0);
+}`;
+
+// Same core layer as PsiField.computeFeatureMaps, one fragment per pixel:
+// out = (edge, motion, color, texture). Color is the luminance itself and is
+// written on the border too, so it doubles as the read-back of the current frame.
+const FEATURE_FRAGMENT_SHADER = `#version 300 es
+precision highp float;
+uniform sampler2D uCurrent;
+uniform sampler2D uPrevious;
+uniform bool uMotion;
+out vec4 features;
+
+float px(ivec2 p) {
+    return texelFetch(uCurrent, p, 0).r;
+}
+
+void main() {
+    ivec2 p = ivec2(gl_FragCoord.xy);
+    ivec2 size = textureSize(uCurrent, 0);
+    float e = px(p);
+    if (p.x < 1 || p.y < 1 || p.x >= size.x - 1 || p.y >= size.y - 1) {
+        features = vec4(0.0, 0.0, e, 0.0);
+        return;
+    }
+    
+    float a = px(p + ivec2(-1, -1)), b = px(p + ivec2(0, -1)), c = px(p + ivec2(1, -1));
+    float d = px(p + ivec2(-1,  0)),                           f = px(p + ivec2(1,  0));
+    float g = px(p + ivec2(-1,  1)), h = px(p + ivec2(0,  1)), i = px(p + ivec2(1,  1));
+    
+    // Sobel edge detection
+    float gx = -a + c - 2.0 * d + 2.0 * f - g + i;
+    float gy = -a - 2.0 * b - c + g + 2.0 * h + i;
+    
+    // Motion detection
+    float motion = uMotion ? abs(e - texelFetch(uPrevious, p, 0).r) : 0.0;
+    
+    // Texture (local variance around the center pixel)
+    vec3 r0 = vec3(a, b, c) - e, r1 = vec3(d, e, f) - e, r2 = vec3(g, h, i) - e;
+    float variance = (dot(r0, r0) + dot(r1, r1) + dot(r2, r2)) / 9.0;
+    
+    features = vec4(abs(gx) + abs(gy), motion, e, variance);
+}`;
+
+// WebGL2 port of the per-frame pixel work. The camera frame is uploaded as an
+// RGBA8 texture, converted to luminance into one of two ping-ponged R32F
+// textures (current/previous), and the feature pass shades every pixel in
+// parallel. The RGBA32F result is read back once so the CPU-side scouts can
+// keep sampling plain Float32Arrays.
+class FeatureMapGPU {
+    static create(width, height) {
+        if (typeof document === 'undefined') return null;
+        
+        const canvas = document.createElement('canvas');
+        canvas.width = width;
+        canvas.height = height;
+        const gl = canvas.getContext('webgl2', { antialias: false, depth: false, stencil: false });
+        // Rendering to (and reading back) float targets needs EXT_color_buffer_float
+        if (!gl || !gl.getExtension('EXT_color_buffer_float')) return null;
+        
+        try {
+            return new FeatureMapGPU(gl, width, height);
+        } catch (err) {
+            console.error('GPU feature maps unavailable:', err);
+            return null;
+        }
+    }
+    
+    constructor(gl, width, height) {
+        this.gl = gl;
+        this.width = width;
+        this.height = height;
+        this.pixels = new Float32Array(width * height * 4);
+        
+        this.lumaProgram = this.createProgram(FULLSCREEN_VERTEX_SHADER, LUMA_FRAGMENT_SHADER);
+        this.uFrame = gl.getUniformLocation(this.lumaProgram, 'uFrame');
+        
+        this.featureProgram = this.createProgram(FULLSCREEN_VERTEX_SHADER, FEATURE_FRAGMENT_SHADER);
+        this.uCurrent = gl.getUniformLocation(this.featureProgram, 'uCurrent');
+        this.uPrevious = gl.getUniformLocation(this.featureProgram, 'uPrevious');
+        this.uMotion = gl.getUniformLocation(this.featureProgram, 'uMotion');
+        
+        this.frameTexture = this.createTexture(gl.RGBA8);
+        // lumaTextures[lumaHead] receives the next frame; the other one holds the previous
+        this.lumaTextures = [this.createTexture(gl.R32F), this.createTexture(gl.R32F)];
+        this.lumaHead = 0;
+        this.featureTexture = this.createTexture(gl.RGBA32F);
+        
+        this.lumaFramebuffers = this.lumaTextures.map(texture => this.createFramebuffer(texture));
+        this.featureFramebuffer = this.createFramebuffer(this.featureTexture);
+        
+        // Camera pixels go up exactly as captured
+        gl.pixelStorei(gl.UNPACK_COLORSPACE_CONVERSION_WEBGL, gl.NONE);
+    }
+    
+    createShader(type, source) {
+        const gl = this.gl;
+        const shader = gl.createShader(type);
+        gl.shaderSource(shader, source);
+        gl.compileShader(shader);
+        if (!gl.getShaderParameter(shader, gl.COMPILE_STATUS)) {
+            throw new Error(gl.getShaderInfoLog(shader));
+        }
+        return shader;
+    }
+    
+    createProgram(vertexSource, fragmentSource) {
+        const gl = this.gl;
+        const program = gl.createProgram();
+        gl.attachShader(program, this.createShader(gl.VERTEX_SHADER, vertexSource));
+        gl.attachShader(program, this.createShader(gl.FRAGMENT_SHADER, fragmentSource));
+        gl.linkProgram(program);
+        if (!gl.getProgramParameter(program, gl.LINK_STATUS)) {
+            throw new Error(gl.getProgramInfoLog(program));
+        }
+        return program;
+    }
+    
+    createTexture(internalFormat) {
+        const gl = this.gl;
+        const texture = gl.createTexture();
+        gl.bindTexture(gl.TEXTURE_2D, texture);
+        // Float textures are not filterable; texelFetch only needs a complete texture
+        gl.texParameteri(gl.TEXTURE_2D, gl.TEXTURE_MIN_FILTER, gl.NEAREST);
+        gl.texParameteri(gl.TEXTURE_2D, gl.TEXTURE_MAG_FILTER, gl.NEAREST);
+        gl.texParameteri(gl.TEXTURE_2D, gl.TEXTURE_WRAP_S, gl.CLAMP_TO_EDGE);
+        gl.texParameteri(gl.TEXTURE_2D, gl.TEXTURE_WRAP_T, gl.CLAMP_TO_EDGE);
+        gl.texStorage2D(gl.TEXTURE_2D, 1, internalFormat, this.width, this.height);
+        return texture;
+    }
+    
+    createFramebuffer(texture) {
+        const gl = this.gl;
+        const framebuffer = gl.createFramebuffer();
+        gl.bindFramebuffer(gl.FRAMEBUFFER, framebuffer);
+        gl.framebufferTexture2D(gl.FRAMEBUFFER, gl.COLOR_ATTACHMENT0, gl.TEXTURE_2D, texture, 0);
+        const status = gl.checkFramebufferStatus(gl.FRAMEBUFFER);
+        gl.bindFramebuffer(gl.FRAMEBUFFER, null);
+        if (status !== gl.FRAMEBUFFER_COMPLETE) {
+            throw new Error('Float framebuffer is not renderable');
+        }
+        return framebuffer;
+    }
+    
+    // Fill field.current and the feature maps from a camera frame; returns false
+    // if the GPU path is unusable. withMotion mirrors the CPU history check.
+    processFrame(imageData, field, withMotion) {
+        const gl = this.gl;
+        if (gl.isContextLost()) return false;
+        
+        const current = this.lumaTextures[this.lumaHead];
+        const previous = this.lumaTextures[1 - this.lumaHead];
+        
+        gl.bindTexture(gl.TEXTURE_2D, this.frameTexture);
+        gl.texSubImage2D(gl.TEXTURE_2D, 0, 0, 0, this.width, this.height, gl.RGBA, gl.UNSIGNED_BYTE, imageData);
+        gl.viewport(0, 0, this.width, this.height);
+        
+        // Luminance pass
+        gl.bindFramebuffer(gl.FRAMEBUFFER, this.lumaFramebuffers[this.lumaHead]);
+        gl.useProgram(this.lumaProgram);
+        gl.activeTexture(gl.TEXTURE0);
+        gl.bindTexture(gl.TEXTURE_2D, this.frameTexture);
+        gl.uniform1i(this.uFrame, 0);
+        gl.drawArrays(gl.TRIANGLES, 0, 3);
+        
+        // Feature pass
+        gl.bindFramebuffer(gl.FRAMEBUFFER, this.featureFramebuffer);
+        gl.useProgram(this.featureProgram);
+        gl.activeTexture(gl.TEXTURE0);
+        gl.bindTexture(gl.TEXTURE_2D, current);
+        gl.uniform1i(this.uCurrent, 0);
+        gl.activeTexture(gl.TEXTURE1);
+        gl.bindTexture(gl.TEXTURE_2D, previous);
+        gl.uniform1i(this.uPrevious, 1);
+        gl.uniform1i(this.uMotion, withMotion ? 1 : 0);
+        gl.drawArrays(gl.TRIANGLES, 0, 3);
+        
+        gl.readPixels(0, 0, this.width, this.height, gl.RGBA, gl.FLOAT, this.pixels);
+        gl.bindFramebuffer(gl.FRAMEBUFFER, null);
+        this.lumaHead = 1 - this.lumaHead;
+        
+        // Split the interleaved RGBA result back into the separate maps
+        const pixels = this.pixels;
+        const { current: luminance, edgeMap, motionMap, colorMap, textureMap } = field;
+        for (let i = 0, p = 0; i < edgeMap.length; i++, p += 4) {
+            edgeMap[i] = pixels[p];
+            motionMap[i] = pixels[p + 1];
+            colorMap[i] = pixels[p + 2];
+            luminance[i] = pixels[p + 2];
+            textureMap[i] = pixels[p + 3];
+        }
+        return true;
+    }
+    
+    destroy() {
+        const gl = this.gl;
+        this.lumaFramebuffers.forEach(framebuffer => gl.deleteFramebuffer(framebuffer));
+        gl.deleteFramebuffer(this.featureFramebuffer);
+        this.lumaTextures.forEach(texture => gl.deleteTexture(texture));
+        gl.deleteTexture(this.frameTexture);
+        gl.deleteTexture(this.featureTexture);
+        gl.deleteProgram(this.lumaProgram);
+        gl.deleteProgram(this.featureProgram);
+    }
+}
+
+// Build the CPU core-layer kernel for a fixed w x h field. The dimensions are
+// baked into the generated source as literals (row offsets become shifts when w
+// is a power of two) and the motion branch is resolved at generation time, so
+// V8 compiles a monomorphic loop with no instance reads or per-pixel branches.
+function makeFeatureKernel(w, h, withMotion) {
+    const row = y => ((w & (w - 1)) === 0 ? `((${y}) << ${Math.log2(w)})` : `((${y}) * ${w})`);
+    
+    // Single sweep over the core layer with three rolling row offsets. Every
+    // 3x3 term is separable into per-column sums, so each step only loads the
+    // new right-hand column and rotates the left/center columns in registers.
+    const body = `
+        for (let y = 1; y < ${h - 1}; y++) {
+            const rowN1 = ${row('y - 1')};
+            const row0 = ${row('y')};
+            const rowP1 = ${row('y + 1')};
+            
+            // Column terms: Sobel smoothing (s), Sobel difference (d), sum, sum of squares
+            let t = cur[rowN1], m = cur[row0], b = cur[rowP1];
+            let sL = t + 2 * m + b, dL = b - t, sumL = t + m + b, sqL = t * t + m * m + b * b;
+            t = cur[rowN1 + 1]; m = cur[row0 + 1]; b = cur[rowP1 + 1];
+            let sC = t + 2 * m + b, dC = b - t, sumC = t + m + b, sqC = t * t + m * m + b * b;
+            let e = m;
+            
+            for (let x = 1; x < ${w - 1}; x++) {
+                t = cur[rowN1 + x + 1]; m = cur[row0 + x + 1]; b = cur[rowP1 + x + 1];
+                const sR = t + 2 * m + b, dR = b - t, sumR = t + m + b, sqR = t * t + m * m + b * b;
+                const idx = row0 + x;
+                
+                // Sobel edge detection
+                const gx = sR - sL;
+                const gy = dL + 2 * dC + dR;
+                edgeMap[idx] = Math.abs(gx) + Math.abs(gy);
+                
+                ${withMotion ? '// Motion detection\n                motionMap[idx] = Math.abs(e - prev[idx]);' : ''}
+                
+                // Color intensity
+                colorMap[idx] = e;
+                
+                // Texture (local variance around the center pixel):
+                // sum((v - e)^2) = sum(v^2) - 2e * sum(v) + 9e^2
+                const sum = sumL + sumC + sumR;
+                const sq = sqL + sqC + sqR;
+                textureMap[idx] = (sq - 2 * e * sum + 9 * e * e) * ${1 / 9};
+                
+                sL = sC; dL = dC; sumL = sumC; sqL = sqC;
+                sC = sR; dC = dR; sumC = sumR; sqC = sqR;
+                e = m;
+            }
+        }`;
+    
+    // eslint-disable-next-line no-new-func
+    return new Function('cur', 'prev', 'edgeMap', 'motionMap', 'colorMap', 'textureMap', body);
+}
+
+// Generated once at module load: [without motion, with motion]
+const FEATURE_KERNELS = [false, true].map(withMotion => makeFeatureKernel(FIELD_SIZE, FIELD_SIZE, withMotion));
+
 // The Psi Field - Our shared "retina" driven by webcam
 class PsiField {
-    constructor() {
+    // shared: back the arrays scout workers read with SharedArrayBuffers
+    constructor(shared = canShareMemory()) {
         this.width = FIELD_SIZE;
         this.height = FIELD_SIZE;
-        this.current = new Float32Array(FIELD_SIZE * FIELD_SIZE);
+        this.current = allocTypedArray(Float32Array, FIELD_SIZE * FIELD_SIZE, shared);
         this.previous = new Float32Array(FIELD_SIZE * FIELD_SIZE);
-        this.history = [];
         this.maxHistory = 5;
         
+        // Ring buffer of recent frames, preallocated so frames never allocate
+        this.history = Array.from({ length: this.maxHistory }, () => new Float32Array(FIELD_SIZE * FIELD_SIZE));
+        this.historyHead = 0;
+        this.historyCount = 0;
+        
         // Feature maps - the "core layer" like Layer 1 in the paper
-        this.edgeMap = new Float32Array(FIELD_SIZE * FIELD_SIZE);
-        this.motionMap = new Float32Array(FIELD_SIZE * FIELD_SIZE);
-        this.colorMap = new Float32Array(FIELD_SIZE * FIELD_SIZE);
-        this.textureMap = new Float32Array(FIELD_SIZE * FIELD_SIZE);
+        this.edgeMap = allocTypedArray(Float32Array, FIELD_SIZE * FIELD_SIZE, shared);
+        this.motionMap = allocTypedArray(Float32Array, FIELD_SIZE * FIELD_SIZE, shared);
+        this.colorMap = allocTypedArray(Float32Array, FIELD_SIZE * FIELD_SIZE, shared);
+        this.textureMap = allocTypedArray(Float32Array, FIELD_SIZE * FIELD_SIZE, shared);
         
         // Attractor field - emergent from scout collective
-        this.attractorField = new Float32Array(FIELD_SIZE * FIELD_SIZE);
+        this.attractorField = allocTypedArray(Float32Array, FIELD_SIZE * FIELD_SIZE, shared);
+        // Fixed-point scatter target (see scatterActivations); integer adds are
+        // order-independent and can be done with Atomics.add from several workers
+        this.attractorAccum = allocTypedArray(Int32Array, FIELD_SIZE * FIELD_SIZE, shared);
+        
+        // Optional FeatureMapGPU; updateFromImage falls back to the CPU without it
+        this.gpu = null;
     }
     
     updateFromImage(imageData) {
         // Store previous state
         this.previous.set(this.current);
         
-        // Convert to luminance and update current
-        for (let i = 0; i < this.current.length; i++) {
-            const r = imageData.data[i * 4] / 255;
-            const g = imageData.data[i * 4 + 1] / 255;
-            const b = imageData.data[i * 4 + 2] / 255;
-            this.current[i] = 0.299 * r + 0.587 * g + 0.114 * b;
-        }
-        
-        // Add to history
-        this.history.push(new Float32Array(this.current));
-        if (this.history.length > this.maxHistory) {
-            this.history.shift();
+        // On the GPU, luminance and feature maps come back from one pass. This
+        // frame is not in the history yet, hence >= 1 for the CPU's >= 2 check.
+        if (this.gpu && this.gpu.processFrame(imageData, this, this.historyCount >= 1)) {
+            this.pushHistory();
+            return;
         }
         
+        this.computeLuminance(imageData);
+        this.pushHistory();
         this.computeFeatureMaps();
     }
     
-    computeFeatureMaps() {
-        // Edge detection (core layer processing)
-        for (let y = 1; y < this.height - 1; y++) {
-            for (let x = 1; x < this.width - 1; x++) {
-                const idx = y * this.width + x;
-                
-                // Sobel edge detection
-                const gx = (
-                    -this.current[idx - this.width - 1] + this.current[idx - this.width + 1] +
-                    -2 * this.current[idx - 1] + 2 * this.current[idx + 1] +
-                    -this.current[idx + this.width - 1] + this.current[idx + this.width + 1]
-                );
-                
-                const gy = (
-                    -this.current[idx - this.width - 1] - 2 * this.current[idx - this.width] - this.current[idx - this.width + 1] +
-                    this.current[idx + this.width - 1] + 2 * this.current[idx + this.width] + this.current[idx + this.width + 1]
-                );
-                
-                this.edgeMap[idx] = Math.sqrt(gx * gx + gy * gy);
-                
-                // Motion detection
-                if (this.history.length >= 2) {
-                    const motion = Math.abs(this.current[idx] - this.previous[idx]);
-                    this.motionMap[idx] = motion;
-                }
-                
-                // Color intensity
-                this.colorMap[idx] = this.current[idx];
-                
-                // Texture (local variance)
-                let variance = 0;
-                let count = 0;
-                const mean = this.current[idx];
-                for (let dy = -1; dy <= 1; dy++) {
-                    for (let dx = -1; dx <= 1; dx++) {
-                        const nidx = (y + dy) * this.width + (x + dx);
-                        if (nidx >= 0 && nidx < this.current.length) {
-                            variance += (this.current[nidx] - mean) * (this.current[nidx] - mean);
-                            count++;
-                        }
-                    }
-                }
-                this.textureMap[idx] = variance / count;
-            }
+    // Convert to luminance and update current. Each pixel is read as one packed
+    // 32-bit RGBA word (little-endian) and the /255 is folded into the weights.
+    computeLuminance(imageData) {
+        const cur = this.current;
+        const rgba = new Uint32Array(imageData.data.buffer, imageData.data.byteOffset, cur.length);
+        for (let i = 0; i < cur.length; i++) {
+            const p = rgba[i];
+            cur[i] = (p & 0xFF) * LUMA_R + ((p >>> 8) & 0xFF) * LUMA_G + ((p >>> 16) & 0xFF) * LUMA_B;
         }
     }
     
-    updateAttractorField(scouts) {
-        // Reset attractor field
-        this.attractorField.fill(0);
-        
-        // Each scout contributes to the field based on its activation
-        scouts.forEach(scout => {
-            const x = Math.floor(scout.x);
-            const y = Math.floor(scout.y);
-            if (x >= 0 && x < this.width && y >= 0 && y < this.height) {
-                const idx = y * this.width + x;
-                this.attractorField[idx] += scout.activation * 0.1;
-            }
-        });
-        
-        // Smooth the attractor field
-        this.smoothField(this.attractorField);
+    // Add to history (overwrites the oldest slot once full)
+    pushHistory() {
+        this.history[this.historyHead].set(this.current);
+        this.historyHead = (this.historyHead + 1) % this.maxHistory;
+        if (this.historyCount < this.maxHistory) this.historyCount++;
     }
     
-    smoothField(field) {
-        const temp = new Float32Array(field.length);
-        for (let y = 1; y < this.height - 1; y++) {
-            for (let x = 1; x < this.width - 1; x++) {
-                const idx = y * this.width + x;
-                let sum = 0;
-                let count = 0;
-                for (let dy = -1; dy <= 1; dy++) {
-                    for (let dx = -1; dx <= 1; dx++) {
-                        const nidx = (y + dy) * this.width + (x + dx);
-                        sum += field[nidx];
-                        count++;
-                    }
-                }
-                temp[idx] = sum / count;
-            }
-        }
-        field.set(temp);
+    computeFeatureMaps() {
+        const kernel = FEATURE_KERNELS[this.historyCount >= 2 ? 1 : 0];
+        kernel(this.current, this.previous, this.edgeMap, this.motionMap, this.colorMap, this.textureMap);
     }
-}
-
-// Individual Scout - A "minimodel" like individual V1 neurons
-class Scout {
-    constructor(type) {
-        this.type = type;
-        this.x = Math.random() * FIELD_SIZE;
-        this.y = Math.random() * FIELD_SIZE;
-        this.vx = 0;
-        this.vy = 0;
-        this.activation = 0;
-        this.age = 0;
-        this.clusterId = -1;
-        this.energy = Math.random() * 0.5 + 0.5;
-        
-        // Each scout has its own "readout weights" like the paper
-        this.sensitivity = Math.random() * 0.5 + 0.5;
-        this.threshold = Math.random() * 0.3 + 0.1;
+    
+    // Fresh private accumulator, out of reach of workers that are still running
+    detachAccumulator() {
+        this.attractorAccum = new Int32Array(this.attractorAccum.length);
     }
     
-    update(psiField) {
-        this.age++;
-        
-        const x = Math.floor(this.x);
-        const y = Math.floor(this.y);
-        if (x < 0 || x >= psiField.width || y < 0 || y >= psiField.height) return;
-        
-        const idx = y * psiField.width + x;
-        
-        // Each scout type responds to different features (minimodel specificity)
-        let stimulus = 0;
-        let fx = 0, fy = 0;
-        
-        switch (this.type) {
-            case SCOUT_TYPES.EDGE_VERTICAL:
-                stimulus = this.getVerticalEdge(psiField, x, y);
-                break;
-            case SCOUT_TYPES.EDGE_HORIZONTAL:
-                stimulus = this.getHorizontalEdge(psiField, x, y);
-                break;
-            case SCOUT_TYPES.EDGE_DIAGONAL_1:
-                stimulus = this.getDiagonalEdge1(psiField, x, y);
-                break;
-            case SCOUT_TYPES.EDGE_DIAGONAL_2:
-                stimulus = this.getDiagonalEdge2(psiField, x, y);
-                break;
-            case SCOUT_TYPES.MOTION_UP:
-            case SCOUT_TYPES.MOTION_DOWN:
-            case SCOUT_TYPES.MOTION_LEFT:
-            case SCOUT_TYPES.MOTION_RIGHT:
-                stimulus = psiField.motionMap[idx];
-                break;
-            case SCOUT_TYPES.COLOR_BRIGHT:
-                stimulus = psiField.colorMap[idx];
-                break;
-            case SCOUT_TYPES.COLOR_DARK:
-                stimulus = 1.0 - psiField.colorMap[idx];
-                break;
-            case SCOUT_TYPES.TEXTURE_HIGH:
-                stimulus = psiField.textureMap[idx];
-                break;
-            case SCOUT_TYPES.TEXTURE_LOW:
-                stimulus = Math.max(0, 0.5 - psiField.textureMap[idx]);
-                break;
+    // scattered: scout workers already accumulated their shards into attractorAccum.
+    // The accumulator already holds the 3x3-smoothed field (see scatterActivations).
+    // Returns the total field energy (sum of the smoothed field).
+    updateAttractorField(pool, scattered = false) {
+        // Each scout contributes to the field based on its activation
+        if (!scattered) {
+            scatterActivations(pool, 0, pool.count, this, false);
         }
         
-        // Activation follows the minimodel principle: simple weighted sum
-        this.activation = this.activation * 0.9 + stimulus * this.sensitivity * 0.1;
-        
-        // Movement based on gradient following (like neural hill climbing)
-        if (this.activation > this.threshold) {
-            const gradient = this.getGradient(psiField, x, y);
-            fx = gradient.x * this.activation * 5;
-            fy = gradient.y * this.activation * 5;
-            
-            // Add attraction to other active scouts of same type (clustering)
-            const clusterForce = this.getClusterForce(psiField);
-            fx += clusterForce.x;
-            fy += clusterForce.y;
+        // Back to float, clearing the accumulator for the next frame in the same pass
+        const accum = this.attractorAccum;
+        const field = this.attractorField;
+        const scale = 1 / ATTRACTOR_SCALE;
+        let sum = 0;
+        for (let i = 0; i < field.length; i++) {
+            const val = accum[i] * scale;
+            field[i] = val;
+            sum += val;
+            accum[i] = 0;
         }
+        return sum;
+    }
+}
+
+// Scout population - each scout is a "minimodel" like individual V1 neurons,
+// stored as parallel typed arrays (one slot per scout) so every field is contiguous
+class ScoutPool {
+    constructor(capacity = MAX_SCOUTS, shared = canShareMemory()) {
+        this.capacity = capacity;
+        this.count = 0;
         
-        // Add some exploration noise
-        fx += (Math.random() - 0.5) * 1.0;
-        fy += (Math.random() - 0.5) * 1.0;
-        
-        // Update velocity and position
-        this.vx = this.vx * 0.8 + fx * 0.1;
-        this.vy = this.vy * 0.8 + fy * 0.1;
+        // Scouts of type t occupy the contiguous index range [typeStarts[t], typeStarts[t + 1])
+        this.typeStarts = allocTypedArray(Int32Array, ATTRACTOR_TYPES + 1, shared);
         
-        this.x += this.vx;
-        this.y += this.vy;
+        this.types = allocTypedArray(Uint8Array, capacity, shared);
+        this.xs = allocTypedArray(Float32Array, capacity, shared);
+        this.ys = allocTypedArray(Float32Array, capacity, shared);
+        this.vxs = allocTypedArray(Float32Array, capacity, shared);
+        this.vys = allocTypedArray(Float32Array, capacity, shared);
+        // Quantized state, ACTIVATION_SCALE fixed point
+        this.activations = allocTypedArray(Uint16Array, capacity, shared);
+        this.energies = allocTypedArray(Uint16Array, capacity, shared);
+        this.ages = allocTypedArray(Uint32Array, capacity, shared);
         
-        // Boundary conditions
-        this.x = Math.max(5, Math.min(FIELD_SIZE - 5, this.x));
-        this.y = Math.max(5, Math.min(FIELD_SIZE - 5, this.y));
+        // Field index each scout samples this frame (see gatherScoutIndices)
+        this.idxs = allocTypedArray(Int32Array, capacity, shared);
         
-        // Energy dynamics
-        this.energy = this.energy * 0.99 + this.activation * 0.01;
+        // Each scout has its own "readout weights" like the paper (PARAM_SCALE fixed point)
+        this.sensitivities = allocTypedArray(Uint8Array, capacity, shared);
+        this.thresholds = allocTypedArray(Uint8Array, capacity, shared);
     }
     
-    getVerticalEdge(field, x, y) {
-        if (x <= 0 || x >= field.width - 1) return 0;
-        const idx = y * field.width + x;
-        return Math.abs(field.current[idx - 1] - field.current[idx + 1]);
+    populate(scoutsPerType) {
+        // Scouts are laid out sorted by type so each type-specialized
+        // kernel in updateScouts walks one contiguous range
+        let i = 0;
+        Object.values(SCOUT_TYPES).forEach(type => {
+            this.typeStarts[type] = i;
+            for (let n = 0; n < scoutsPerType && i < this.capacity; n++, i++) {
+                this.types[i] = type;
+                this.ages[i] = 0;
+                this.sensitivities[i] = Math.round((Math.random() * 0.5 + 0.5) * PARAM_SCALE);
+                this.thresholds[i] = Math.round((Math.random() * 0.3 + 0.1) * PARAM_SCALE);
+                this.respawn(i);
+            }
+        });
+        this.typeStarts[ATTRACTOR_TYPES] = i;
+        this.count = i;
     }
     
-    getHorizontalEdge(field, x, y) {
-        if (y <= 0 || y >= field.height - 1) return 0;
-        const idx = y * field.width + x;
-        return Math.abs(field.current[idx - field.width] - field.current[idx + field.width]);
+    respawn(i) {
+        this.xs[i] = Math.random() * FIELD_SIZE;
+        this.ys[i] = Math.random() * FIELD_SIZE;
+        this.vxs[i] = 0;
+        this.vys[i] = 0;
+        this.activations[i] = 0;
+        this.energies[i] = Math.round((Math.random() * 0.5 + 0.5) * ACTIVATION_SCALE);
     }
     
-    getDiagonalEdge1(field, x, y) {
-        if (x <= 0 || x >= field.width - 1 || y <= 0 || y >= field.height - 1) return 0;
-        const idx = y * field.width + x;
-        return Math.abs(field.current[idx - field.width - 1] - field.current[idx + field.width + 1]);
+    reset() {
+        for (let i = 0; i < this.count; i++) {
+            this.respawn(i);
+        }
     }
     
-    getDiagonalEdge2(field, x, y) {
-        if (x <= 0 || x >= field.width - 1 || y <= 0 || y >= field.height - 1) return 0;
-        const idx = y * field.width + x;
-        return Math.abs(field.current[idx - field.width + 1] - field.current[idx + field.width - 1]);
+    // Swap every array for a private copy, out of reach of workers that are still
+    // running (a terminated worker may finish the shard it is on)
+    detach() {
+        for (const [key, value] of Object.entries(this)) {
+            if (ArrayBuffer.isView(value)) this[key] = value.slice();
+        }
+    }
+}
+
+// Shards updateScouts across Web Workers. Only available on cross-origin isolated
+// pages, where the scout pool and feature maps live in SharedArrayBuffers.
+class ScoutWorkerPool {
+    static create(pool, field) {
+        if (!canShareMemory() || typeof Worker === 'undefined') return null;
+        if (!(pool.xs.buffer instanceof SharedArrayBuffer) || !(field.current.buffer instanceof SharedArrayBuffer)) return null;
+        // postMessage would hand the workers a copy of a plain accumulator, and their
+        // Atomics.add scatter would never reach the main thread
+        if (!(field.attractorAccum.buffer instanceof SharedArrayBuffer)) return null;
+        
+        const size = Math.min(navigator.hardwareConcurrency || 4, MAX_SCOUT_WORKERS);
+        return new ScoutWorkerPool(pool, field, size);
     }
     
-    getGradient(field, x, y) {
-        let gx = 0, gy = 0;
+    constructor(pool, field, size) {
+        this.frame = 0;
+        this.pending = 0;
+        this.active = 0;
+        this.resolve = null;
+        this.reject = null;
+        this.inFlight = null;
+        this.error = null;
         
-        switch (this.type) {
-            case SCOUT_TYPES.EDGE_VERTICAL:
-            case SCOUT_TYPES.EDGE_HORIZONTAL:
-            case SCOUT_TYPES.EDGE_DIAGONAL_1:
-            case SCOUT_TYPES.EDGE_DIAGONAL_2:
-                if (x > 0 && x < field.width - 1) {
-                    gx = field.edgeMap[(y * field.width) + x + 1] - field.edgeMap[(y * field.width) + x - 1];
-                }
-                if (y > 0 && y < field.height - 1) {
-                    gy = field.edgeMap[((y + 1) * field.width) + x] - field.edgeMap[((y - 1) * field.width) + x];
-                }
-                break;
-            case SCOUT_TYPES.MOTION_UP:
-            case SCOUT_TYPES.MOTION_DOWN:
-            case SCOUT_TYPES.MOTION_LEFT:
-            case SCOUT_TYPES.MOTION_RIGHT:
-                if (x > 0 && x < field.width - 1) {
-                    gx = field.motionMap[(y * field.width) + x + 1] - field.motionMap[(y * field.width) + x - 1];
-                }
-                if (y > 0 && y < field.height - 1) {
-                    gy = field.motionMap[((y + 1) * field.width) + x] - field.motionMap[((y - 1) * field.width) + x];
-                }
-                break;
-            default:
-                if (x > 0 && x < field.width - 1) {
-                    gx = field.colorMap[(y * field.width) + x + 1] - field.colorMap[(y * field.width) + x - 1];
-                }
-                if (y > 0 && y < field.height - 1) {
-                    gy = field.colorMap[((y + 1) * field.width) + x] - field.colorMap[((y - 1) * field.width) + x];
-                }
-                break;
-        }
+        // Typed arrays over SharedArrayBuffers are shared, not copied, by postMessage
+        const init = {
+            type: 'init',
+            pool: {
+                typeStarts: pool.typeStarts,
+                types: pool.types,
+                xs: pool.xs,
+                ys: pool.ys,
+                vxs: pool.vxs,
+                vys: pool.vys,
+                activations: pool.activations,
+                energies: pool.energies,
+                ages: pool.ages,
+                idxs: pool.idxs,
+                sensitivities: pool.sensitivities,
+                thresholds: pool.thresholds
+            },
+            field: {
+                width: field.width,
+                height: field.height,
+                current: field.current,
+                edgeMap: field.edgeMap,
+                motionMap: field.motionMap,
+                colorMap: field.colorMap,
+                textureMap: field.textureMap,
+                attractorField: field.attractorField,
+                attractorAccum: field.attractorAccum
+            }
+        };
         
-        return { x: gx, y: gy };
+        this.workers = Array.from({ length: size }, () => {
+            const worker = new Worker(new URL('./scoutWorker.js', import.meta.url));
+            worker.onmessage = ({ data }) => this.onShardDone(data.frame, data.active);
+            worker.onerror = event => this.fail(new Error(`Scout worker failed: ${event.message}`));
+            worker.onmessageerror = () => this.fail(new Error('Scout worker reply could not be deserialized'));
+            worker.postMessage(init);
+            return worker;
+        });
     }
     
-    getClusterForce(field) {
-        // Simplified clustering - attract to attractor field
-        const x = Math.floor(this.x);
-        const y = Math.floor(this.y);
-        let fx = 0, fy = 0;
+    // Resolves with the active scout count once every worker has finished its shard.
+    // Rejects if any worker fails; the pool is terminated and should be dropped.
+    update(pool) {
+        // A frame abandoned mid-flight (loop stopped and restarted before the workers
+        // replied) still writes the shared pool and accumulator, so let it drain first.
+        // Its own waiter is queued on the same promise ahead of us and runs first.
+        const run = () => this.dispatch(pool);
+        if (this.error) return Promise.reject(this.error);
+        this.inFlight = this.pending > 0 ? this.inFlight.then(run) : run();
+        return this.inFlight;
+    }
+    
+    dispatch(pool) {
+        if (this.error) return Promise.reject(this.error);
+        const shard = Math.ceil(pool.count / this.workers.length);
+        this.frame++;
         
-        if (x > 0 && x < field.width - 1 && y > 0 && y < field.height - 1) {
-            const idx = y * field.width + x;
-            fx = (field.attractorField[idx + 1] - field.attractorField[idx - 1]) * 2;
-            fy = (field.attractorField[idx + field.width] - field.attractorField[idx - field.width]) * 2;
+        return new Promise((resolve, reject) => {
+            this.resolve = resolve;
+            this.reject = reject;
+            this.pending = this.workers.length;
+            this.active = 0;
+            this.workers.forEach((worker, k) => {
+                const lo = Math.min(pool.count, k * shard);
+                const hi = Math.min(pool.count, lo + shard);
+                worker.postMessage({ type: 'update', frame: this.frame, lo, hi });
+            });
+        });
+    }
+    
+    onShardDone(frame, active) {
+        // Late reply for a frame that is no longer the one being collected
+        if (frame !== this.frame || this.pending === 0) return;
+        this.active += active;
+        if (--this.pending === 0 && this.resolve) {
+            const resolve = this.resolve;
+            this.resolve = null;
+            this.reject = null;
+            resolve(this.active);
         }
-        
-        return { x: fx, y: fy };
+    }
+    
+    // One failed worker would leave its shard pending forever, so give up on the
+    // whole pool and fail the frame being collected (if any)
+    fail(error) {
+        if (this.error) return;
+        this.error = error;
+        this.terminate();
+        this.pending = 0;
+        if (this.reject) {
+            const reject = this.reject;
+            this.resolve = null;
+            this.reject = null;
+            reject(error);
+        }
+    }
+    
+    terminate() {
+        this.workers.forEach(worker => worker.terminate());
+        this.workers = [];
     }
 }
 
+// ImageData reused across frames, plus a packed view for one 32-bit store per
+// pixel. Canvas pixels are RGBA in memory, i.e. 0xAABBGGRR on little-endian hosts.
+function createPixelBuffer(ctx) {
+    const image = ctx.createImageData(FIELD_SIZE, FIELD_SIZE);
+    return { image, pixels: new Uint32Array(image.data.buffer) };
+}
+
+// Run callback once per new camera frame where requestVideoFrameCallback is
+// supported (webcams usually deliver ~30 fps, so a 60 Hz requestAnimationFrame
+// loop would process every frame twice), else on the next display frame.
+// Returns a function that cancels the pending callback.
+function scheduleVideoFrame(video, callback) {
+    if (typeof video.requestVideoFrameCallback === 'function') {
+        const handle = video.requestVideoFrameCallback(callback);
+        return () => video.cancelVideoFrameCallback(handle);
+    }
+    const handle = requestAnimationFrame(callback);
+    return () => cancelAnimationFrame(handle);
+}
+
+// Scout type toggles. Memoized: it only depends on scoutVisibility, so the
+// periodic stats updates do not re-render the twelve checkboxes.
+const ScoutControlPanel = React.memo(({ scoutVisibility, onToggle }) => (
+    <div className="p-4 bg-gray-800 border-t border-gray-700">
+        <div className="grid grid-cols-6 gap-2 text-xs">
+            {Object.entries(SCOUT_TYPES).map(([name, type]) => (
+                <label key={type} className="flex items-center gap-2 cursor-pointer p-2 rounded hover:bg-gray-700">
+                    <input 
+                        type="checkbox" 
+                        checked={scoutVisibility[type]} 
+                        onChange={() => onToggle(type)}
+                        className="form-checkbox h-3 w-3 accent-cyan-400"
+                    />
+                    <div 
+                        className="w-3 h-3 rounded" 
+                        style={{ backgroundColor: SCOUT_COLORS[type] }}
+                    />
+                    <span className="text-gray-300">{name.replace('_', ' ')}</span>
+                </label>
+            ))}
+        </div>
+    </div>
+));
+
 // Main Intelligence System
 const MassivelyParallelGeometricIntelligence = () => {
     const [isRunning, setIsRunning] = useState(false);
@@ -369,23 +708,61 @@ const MassivelyParallelGeometricIntelligence = () => {
     const fieldCanvasRef = useRef(null);
     const scoutCanvasRef = useRef(null);
     const attractorCanvasRef = useRef(null);
-    const animationRef = useRef(null);
+    const animationRef = useRef(null); // cancels the pending frame callback
+    const loopIdRef = useRef(0);
+    const lastStatsRef = useRef(0);
     
-    const psiFieldRef = useRef(new PsiField());
-    const scoutsRef = useRef([]);
+    // Created once rather than per render: the arrays may be SharedArrayBuffer-backed
+    const psiFieldRef = useRef(null);
+    if (psiFieldRef.current === null) psiFieldRef.current = new PsiField();
+    const scoutPoolRef = useRef(null);
+    if (scoutPoolRef.current === null) scoutPoolRef.current = new ScoutPool();
+    const scoutWorkersRef = useRef(null);
+    const fieldImageRef = useRef(null);
+    const attractorImageRef = useRef(null);
+    const scoutImageRef = useRef(null);
+    // scoutVisibility as bytes indexed by scout type, read by the render loop
+    const visibleTypesRef = useRef(new Uint8Array(ATTRACTOR_TYPES));
     
     // Initialize scouts
     useEffect(() => {
-        const scouts = [];
         const scoutsPerType = Math.floor(MAX_SCOUTS / ATTRACTOR_TYPES);
+        scoutPoolRef.current.populate(scoutsPerType);
+    }, []);
+    
+    // Shard the scout update across Web Workers when shared memory is available
+    useEffect(() => {
+        const workers = ScoutWorkerPool.create(scoutPoolRef.current, psiFieldRef.current);
+        scoutWorkersRef.current = workers;
         
-        Object.values(SCOUT_TYPES).forEach(type => {
-            for (let i = 0; i < scoutsPerType; i++) {
-                scouts.push(new Scout(type));
-            }
-        });
+        return () => {
+            if (workers) workers.terminate();
+            scoutWorkersRef.current = null;
+        };
+    }, []);
+    
+    // Move the per-pixel luminance and feature passes to the GPU when WebGL2 float targets are available
+    useEffect(() => {
+        const field = psiFieldRef.current;
+        const gpu = FeatureMapGPU.create(FIELD_SIZE, FIELD_SIZE);
+        field.gpu = gpu;
         
-        scoutsRef.current = scouts;
+        return () => {
+            if (gpu) gpu.destroy();
+            field.gpu = null;
+        };
+    }, []);
+    
+    useEffect(() => {
+        const visible = visibleTypesRef.current;
+        for (let type = 0; type < ATTRACTOR_TYPES; type++) {
+            visible[type] = scoutVisibility[type] ? 1 : 0;
+        }
+    }, [scoutVisibility]);
+    
+    // Stable across renders so the memoized ScoutControlPanel can skip re-rendering
+    const toggleScoutType = useCallback((type) => {
+        setScoutVisibility(prev => ({...prev, [type]: !prev[type]}));
     }, []);
     
     const startCamera = useCallback(async () => {
@@ -409,59 +786,83 @@ const MassivelyParallelGeometricIntelligence = () => {
     
     const renderField = useCallback((ctx) => {
         const field = psiFieldRef.current;
-        const imageData = ctx.createImageData(FIELD_SIZE, FIELD_SIZE);
+        if (!fieldImageRef.current) fieldImageRef.current = createPixelBuffer(ctx);
+        const { image, pixels } = fieldImageRef.current;
         
         // Render edge map in red channel, motion in green, texture in blue
-        for (let i = 0; i < field.edgeMap.length; i++) {
-            const edge = Math.min(255, field.edgeMap[i] * 255 * 2);
-            const motion = Math.min(255, field.motionMap[i] * 255 * 10);
-            const texture = Math.min(255, field.textureMap[i] * 255 * 5);
+        const { edgeMap, motionMap, textureMap } = field;
+        for (let i = 0; i < edgeMap.length; i++) {
+            let edge = edgeMap[i] * EDGE_DISPLAY_SCALE;
+            let motion = motionMap[i] * MOTION_DISPLAY_SCALE;
+            let texture = textureMap[i] * TEXTURE_DISPLAY_SCALE;
+            edge = edge < 255 ? edge : 255;
+            motion = motion < 255 ? motion : 255;
+            texture = texture < 255 ? texture : 255;
             
-            imageData.data[i * 4] = edge;         // R - edges
-            imageData.data[i * 4 + 1] = motion;   // G - motion
-            imageData.data[i * 4 + 2] = texture;  // B - texture
-            imageData.data[i * 4 + 3] = 255;      // A
+            pixels[i] = 0xFF000000 | ((texture | 0) << 16) | ((motion | 0) << 8) | (edge | 0);
         }
         
-        ctx.putImageData(imageData, 0, 0);
+        ctx.putImageData(image, 0, 0);
     }, []);
     
     const renderScouts = useCallback((ctx) => {
-        ctx.fillStyle = '#000';
-        ctx.fillRect(0, 0, FIELD_SIZE, FIELD_SIZE);
+        if (!scoutImageRef.current) scoutImageRef.current = createPixelBuffer(ctx);
+        const { image, pixels } = scoutImageRef.current;
+        pixels.fill(0xFF000000);
         
-        // Render scouts by type
-        scoutsRef.current.forEach(scout => {
-            if (!scoutVisibility[scout.type] || scout.activation < 0.1) return;
+        // Rasterize scouts by type straight into the pixel buffer: each one is a
+        // 1-3 px square alpha-blended (source-over) onto what is already there
+        const { types, xs, ys, activations, count } = scoutPoolRef.current;
+        const visible = visibleTypesRef.current;
+        for (let i = 0; i < count; i++) {
+            const activation = activations[i] * (1 / ACTIVATION_SCALE);
+            const type = types[i];
+            if (!visible[type] || activation < 0.1) continue;
             
-            ctx.fillStyle = SCOUT_COLORS[scout.type];
-            ctx.globalAlpha = Math.min(1.0, scout.activation * 2);
+            const color = SCOUT_COLORS_PACKED[type];
+            const alpha = activation < 0.5 ? (activation * 510) | 0 : 255;
+            const inv = 255 - alpha;
+            const r = (color & 0xFF) * alpha;
+            const g = ((color >>> 8) & 0xFF) * alpha;
+            const b = ((color >>> 16) & 0xFF) * alpha;
             
-            const size = 1 + scout.activation * 2;
-            ctx.fillRect(scout.x - size/2, scout.y - size/2, size, size);
-        });
+            // Scouts are clamped to [5, FIELD_SIZE - 5], so the square stays on the canvas
+            const size = Math.round(1 + activation * 2);
+            const x0 = Math.round(xs[i] - size / 2);
+            const y0 = Math.round(ys[i] - size / 2);
+            for (let dy = 0; dy < size; dy++) {
+                let p = (y0 + dy) * FIELD_SIZE + x0;
+                for (let dx = 0; dx < size; dx++, p++) {
+                    const dst = pixels[p];
+                    const outR = ((r + (dst & 0xFF) * inv) / 255) | 0;
+                    const outG = ((g + ((dst >>> 8) & 0xFF) * inv) / 255) | 0;
+                    const outB = ((b + ((dst >>> 16) & 0xFF) * inv) / 255) | 0;
+                    pixels[p] = 0xFF000000 | (outB << 16) | (outG << 8) | outR;
+                }
+            }
+        }
         
-        ctx.globalAlpha = 1.0;
-    }, [scoutVisibility]);
+        ctx.putImageData(image, 0, 0);
+    }, []);
     
     const renderAttractors = useCallback((ctx) => {
         const field = psiFieldRef.current;
-        const imageData = ctx.createImageData(FIELD_SIZE, FIELD_SIZE);
+        if (!attractorImageRef.current) attractorImageRef.current = createPixelBuffer(ctx);
+        const { image, pixels } = attractorImageRef.current;
         
-        // Render attractor field
-        for (let i = 0; i < field.attractorField.length; i++) {
-            const intensity = Math.min(255, field.attractorField[i] * 255 * 10);
+        // Render attractor field in red + green (yellow)
+        const attractor = field.attractorField;
+        for (let i = 0; i < attractor.length; i++) {
+            let intensity = attractor[i] * ATTRACTOR_DISPLAY_SCALE;
+            intensity = intensity < 255 ? intensity | 0 : 255;
             
-            imageData.data[i * 4] = intensity;     // R
-            imageData.data[i * 4 + 1] = intensity; // G
-            imageData.data[i * 4 + 2] = 0;         // B
-            imageData.data[i * 4 + 3] = 255;       // A
+            pixels[i] = 0xFF000000 | (intensity << 8) | intensity;
         }
         
-        ctx.putImageData(imageData, 0, 0);
+        ctx.putImageData(image, 0, 0);
     }, []);
     
-    const animate = useCallback(() => {
+    const animate = useCallback(async (loopId) => {
         if (!isRunning || !videoRef.current) return;
         
         const video = videoRef.current;
@@ -480,12 +881,38 @@ const MassivelyParallelGeometricIntelligence = () => {
                 psiFieldRef.current.updateFromImage(imageData);
                 
                 // Update all scouts (massively parallel minimodels)
-                scoutsRef.current.forEach(scout => {
-                    scout.update(psiFieldRef.current);
-                });
+                const scoutWorkers = scoutWorkersRef.current;
+                let activeScouts;
+                if (scoutWorkers) {
+                    try {
+                        activeScouts = await scoutWorkers.update(scoutPoolRef.current);
+                    } catch (err) {
+                        // Drop the failed pool and update scouts on the main thread from
+                        // now on. Some shards of this frame have already stepped, and a
+                        // terminated worker can still finish its shard, so move the
+                        // scouts and accumulator off the shared buffers and skip this
+                        // frame's step rather than stepping those scouts twice.
+                        console.error('Scout workers unavailable:', err);
+                        if (scoutWorkersRef.current === scoutWorkers) scoutWorkersRef.current = null;
+                        scoutPoolRef.current.detach();
+                        psiFieldRef.current.detachAccumulator();
+                        if (loopId === loopIdRef.current) {
+                            animationRef.current = scheduleVideoFrame(videoRef.current, () => animate(loopId));
+                        }
+                        return;
+                    }
+                    // Stopped or restarted while the workers were busy. Their shards are
+                    // already in the accumulator; drop them so the next frame starts clean.
+                    if (loopId !== loopIdRef.current) {
+                        psiFieldRef.current.attractorAccum.fill(0);
+                        return;
+                    }
+                } else {
+                    activeScouts = updateScouts(scoutPoolRef.current, psiFieldRef.current);
+                }
                 
                 // Update attractor field from scout collective
-                psiFieldRef.current.updateAttractorField(scoutsRef.current);
+                const fieldEnergy = psiFieldRef.current.updateAttractorField(scoutPoolRef.current, scoutWorkers !== null);
                 
                 // Render all views
                 renderInput(inputCtx, imageData);
@@ -493,45 +920,49 @@ const MassivelyParallelGeometricIntelligence = () => {
                 renderScouts(scoutCtx);
                 renderAttractors(attractorCtx);
                 
-                // Update stats
-                const activeScouts = scoutsRef.current.filter(s => s.activation > 0.1).length;
-                const fieldEnergy = psiFieldRef.current.attractorField.reduce((sum, val) => sum + val, 0);
-                
-                setStats({
-                    activeScouts,
-                    clusters: Math.floor(activeScouts / 50), // Rough estimate
-                    fieldEnergy: fieldEnergy.toFixed(2),
-                    coherence: (activeScouts / MAX_SCOUTS).toFixed(3)
-                });
+                // Update stats (counted inside the scout and smoothing passes).
+                // They are informational, so only re-render every STATS_INTERVAL ms.
+                const now = performance.now();
+                if (now - lastStatsRef.current >= STATS_INTERVAL) {
+                    lastStatsRef.current = now;
+                    setStats({
+                        activeScouts,
+                        clusters: Math.floor(activeScouts / 50), // Rough estimate
+                        fieldEnergy: fieldEnergy.toFixed(2),
+                        coherence: (activeScouts / MAX_SCOUTS).toFixed(3)
+                    });
+                }
             }
         }
         
-        animationRef.current = requestAnimationFrame(animate);
+        animationRef.current = scheduleVideoFrame(videoRef.current, () => animate(loopId));
     }, [isRunning, renderInput, renderField, renderScouts, renderAttractors]);
     
     useEffect(() => {
         if (isRunning) {
-            animate();
+            animate(++loopIdRef.current);
         } else if (animationRef.current) {
-            cancelAnimationFrame(animationRef.current);
+            animationRef.current();
         }
         
         return () => {
+            loopIdRef.current++;
             if (animationRef.current) {
-                cancelAnimationFrame(animationRef.current);
+                animationRef.current();
             }
         };
     }, [isRunning, animate]);
     
     const resetSystem = () => {
-        scoutsRef.current.forEach(scout => {
-            scout.x = Math.random() * FIELD_SIZE;
-            scout.y = Math.random() * FIELD_SIZE;
-            scout.vx = 0;
-            scout.vy = 0;
-            scout.activation = 0;
-            scout.energy = Math.random() * 0.5 + 0.5;
-        });
+        // Workers write the shared scout arrays while a frame is in flight, so
+        // respawn only once it has settled (and this frame has been rendered)
+        const scoutWorkers = scoutWorkersRef.current;
+        const reset = () => scoutPoolRef.current.reset();
+        if (scoutWorkers && scoutWorkers.pending > 0) {
+            scoutWorkers.inFlight.then(reset, reset);
+        } else {
+            reset();
+        }
     };
     
     return (
@@ -656,25 +1087,7 @@ const MassivelyParallelGeometricIntelligence = () => {
             </div>
             
             {/* Scout Control Panel */}
-            <div className="p-4 bg-gray-800 border-t border-gray-700">
-                <div className="grid grid-cols-6 gap-2 text-xs">
-                    {Object.entries(SCOUT_TYPES).map(([name, type]) => (
-                        <label key={type} className="flex items-center gap-2 cursor-pointer p-2 rounded hover:bg-gray-700">
-                            <input 
-                                type="checkbox" 
-                                checked={scoutVisibility[type]} 
-                                onChange={() => setScoutVisibility(prev => ({...prev, [type]: !prev[type]}))}
-                                className="form-checkbox h-3 w-3 accent-cyan-400"
-                            />
-                            <div 
-                                className="w-3 h-3 rounded" 
-                                style={{ backgroundColor: SCOUT_COLORS[type] }}
-                            />
-                            <span className="text-gray-300">{name.replace('_', ' ')}</span>
-                        </label>
-                    ))}
-                </div>
-            </div>
+            <ScoutControlPanel scoutVisibility={scoutVisibility} onToggle={toggleScoutType} />
             
             {/* Status Footer */}
             <div className="p-2 bg-gray-800 border-t border-gray-700 text-xs text-gray-400">
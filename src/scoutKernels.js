@@ -0,0 +1,268 @@
+// Scout update kernels, shared by the main thread (App) and scoutWorker.js.
+// They only touch typed arrays, so they run unchanged over views of
+// SharedArrayBuffers when the scout population is sharded across workers.
+
+// SharedArrayBuffer is only exposed to cross-origin isolated pages
+export const canShareMemory = () =>
+    typeof SharedArrayBuffer !== 'undefined' && typeof crossOriginIsolated !== 'undefined' && crossOriginIsolated;
+
+// Fixed-point scale of the attractor accumulator: activation * 0.1 * ATTRACTOR_SCALE
+// per scout stays far below 2^31 even with every scout on one cell
+export const ATTRACTOR_SCALE = 1 << 20;
+
+// Fixed-point scales of the quantized scout state. Activations and energies live
+// in [0, 1] and are Uint16 (8 bits is too coarse for the 0.99 energy decay to
+// register); sensitivities and thresholds are per-scout constants and fit in Uint8.
+export const ACTIVATION_SCALE = 65535;
+export const PARAM_SCALE = 255;
+
+export function allocTypedArray(Type, length, shared = false) {
+    if (!shared) return new Type(length);
+    return new Type(new SharedArrayBuffer(length * Type.BYTES_PER_ELEMENT));
+}
+
+// Update every scout against the psi field; returns the number of active scouts
+export function updateScouts(pool, field) {
+    return updateScoutRange(pool, field, 0, pool.count);
+}
+
+// Update scouts [lo, hi), one specialized kernel per type range. Workers each
+// call this on their own shard of the pool. Returns the active scouts in range.
+export function updateScoutRange(pool, field, lo, hi) {
+    gatherScoutIndices(pool, lo, hi, field.width, field.height);
+    
+    const { typeStarts } = pool;
+    let active = 0;
+    for (let type = 0; type < SCOUT_KERNELS.length; type++) {
+        const start = Math.max(lo, typeStarts[type]);
+        const end = Math.min(hi, typeStarts[type + 1]);
+        if (start < end) active += SCOUT_KERNELS[type](pool, start, end, field);
+    }
+    return active;
+}
+
+// Resolve every scout position to a field index in one tight pass. Positions are
+// clamped to the interior so kernels can read the 3x3 neighborhood without bounds checks.
+function gatherScoutIndices(pool, lo, hi, w, h) {
+    const { xs, ys, idxs } = pool;
+    for (let i = lo; i < hi; i++) {
+        let xi = xs[i] | 0;
+        let yi = ys[i] | 0;
+        xi = xi < 1 ? 1 : (xi > w - 2 ? w - 2 : xi);
+        yi = yi < 1 ? 1 : (yi > h - 2 ? h - 2 : yi);
+        idxs[i] = yi * w + xi;
+    }
+}
+
+// Splat each scout's activation into field.attractorAccum as fixed-point integers,
+// spread evenly over the 3x3 cells around it. This is the scatter and the 3x3 box
+// blur fused into one pass: 9 writes per scout instead of a blur over every cell.
+// atomic: required when several workers scatter into the same shared accumulator
+// (scoutWorker.js on cross-origin isolated pages, see ScoutWorkerPool.create).
+export function scatterActivations(pool, lo, hi, field, atomic) {
+    const { xs, ys, activations } = pool;
+    const accum = field.attractorAccum;
+    const w = field.width;
+    const h = field.height;
+    const scale = (0.1 / 9 / ACTIVATION_SCALE) * ATTRACTOR_SCALE;
+    
+    for (let i = lo; i < hi; i++) {
+        let x = xs[i] | 0;
+        let y = ys[i] | 0;
+        x = x < 1 ? 1 : (x > w - 2 ? w - 2 : x);
+        y = y < 1 ? 1 : (y > h - 2 ? h - 2 : y);
+        const v = Math.round(activations[i] * scale);
+        if (v === 0) continue;
+        
+        const top = (y - 1) * w + x;
+        if (atomic) {
+            for (let r = top; r <= top + 2 * w; r += w) {
+                Atomics.add(accum, r - 1, v);
+                Atomics.add(accum, r, v);
+                Atomics.add(accum, r + 1, v);
+            }
+        } else {
+            for (let r = top; r <= top + 2 * w; r += w) {
+                accum[r - 1] += v;
+                accum[r] += v;
+                accum[r + 1] += v;
+            }
+        }
+    }
+}
+
+// Pull of the gradient map on an active scout. Edge scouts climb edgeMap, the L1
+// Sobel norm |gx| + |gy|, which runs up to sqrt(2) above the Euclidean magnitude
+// it replaced, so their gain is scaled down to keep the same force on strong
+// diagonal edges (axis-aligned edges now pull slightly less).
+const GRADIENT_GAIN = 5;
+const EDGE_GRADIENT_GAIN = GRADIENT_GAIN * Math.SQRT1_2;
+
+// Shared tail of every kernel: activation, movement and energy for scout i.
+// Returns the new activation so kernels can count active scouts as they go.
+function integrateScout(pool, field, i, idx, stimulus, gradientMap, gradientGain) {
+    const { xs, ys, vxs, vys, activations, energies, ages, sensitivities, thresholds } = pool;
+    const w = field.width;
+    const h = field.height;
+    const attractor = field.attractorField;
+    
+    ages[i]++;
+    
+    // Activation follows the minimodel principle: simple weighted sum.
+    // Stimuli are all in [0, 1], so the rounded fixed-point value stays in range.
+    const activation = activations[i] * (0.9 / ACTIVATION_SCALE) + stimulus * sensitivities[i] * (0.1 / PARAM_SCALE);
+    activations[i] = (activation * ACTIVATION_SCALE + 0.5) | 0;
+    
+    // Movement based on gradient following (like neural hill climbing)
+    let fx = 0, fy = 0;
+    if (activation > thresholds[i] * (1 / PARAM_SCALE)) {
+        fx = (gradientMap[idx + 1] - gradientMap[idx - 1]) * activation * gradientGain;
+        fy = (gradientMap[idx + w] - gradientMap[idx - w]) * activation * gradientGain;
+        
+        // Add attraction to other active scouts of same type (clustering)
+        fx += (attractor[idx + 1] - attractor[idx - 1]) * 2;
+        fy += (attractor[idx + w] - attractor[idx - w]) * 2;
+    }
+    
+    // Add some exploration noise
+    fx += (Math.random() - 0.5) * 1.0;
+    fy += (Math.random() - 0.5) * 1.0;
+    
+    // Update velocity and position
+    const vx = vxs[i] * 0.8 + fx * 0.1;
+    const vy = vys[i] * 0.8 + fy * 0.1;
+    vxs[i] = vx;
+    vys[i] = vy;
+    
+    // Boundary conditions
+    xs[i] = Math.max(5, Math.min(w - 5, xs[i] + vx));
+    ys[i] = Math.max(5, Math.min(h - 5, ys[i] + vy));
+    
+    // Energy dynamics
+    energies[i] = (energies[i] * 0.99 + activation * (0.01 * ACTIVATION_SCALE) + 0.5) | 0;
+    return activation;
+}
+
+function updateEdgeVertical(pool, lo, hi, field) {
+    const { idxs } = pool;
+    const cur = field.current;
+    let active = 0;
+    for (let i = lo; i < hi; i++) {
+        const idx = idxs[i];
+        const stimulus = Math.abs(cur[idx - 1] - cur[idx + 1]);
+        if (integrateScout(pool, field, i, idx, stimulus, field.edgeMap, EDGE_GRADIENT_GAIN) > 0.1) active++;
+    }
+    return active;
+}
+
+function updateEdgeHorizontal(pool, lo, hi, field) {
+    const { idxs } = pool;
+    const w = field.width;
+    const cur = field.current;
+    let active = 0;
+    for (let i = lo; i < hi; i++) {
+        const idx = idxs[i];
+        const stimulus = Math.abs(cur[idx - w] - cur[idx + w]);
+        if (integrateScout(pool, field, i, idx, stimulus, field.edgeMap, EDGE_GRADIENT_GAIN) > 0.1) active++;
+    }
+    return active;
+}
+
+function updateEdgeDiagonal1(pool, lo, hi, field) {
+    const { idxs } = pool;
+    const w = field.width;
+    const cur = field.current;
+    let active = 0;
+    for (let i = lo; i < hi; i++) {
+        const idx = idxs[i];
+        const stimulus = Math.abs(cur[idx - w - 1] - cur[idx + w + 1]);
+        if (integrateScout(pool, field, i, idx, stimulus, field.edgeMap, EDGE_GRADIENT_GAIN) > 0.1) active++;
+    }
+    return active;
+}
+
+function updateEdgeDiagonal2(pool, lo, hi, field) {
+    const { idxs } = pool;
+    const w = field.width;
+    const cur = field.current;
+    let active = 0;
+    for (let i = lo; i < hi; i++) {
+        const idx = idxs[i];
+        const stimulus = Math.abs(cur[idx - w + 1] - cur[idx + w - 1]);
+        if (integrateScout(pool, field, i, idx, stimulus, field.edgeMap, EDGE_GRADIENT_GAIN) > 0.1) active++;
+    }
+    return active;
+}
+
+// All four motion types share the same (undirected) motion response
+function updateMotion(pool, lo, hi, field) {
+    const { idxs } = pool;
+    const motion = field.motionMap;
+    let active = 0;
+    for (let i = lo; i < hi; i++) {
+        const idx = idxs[i];
+        if (integrateScout(pool, field, i, idx, motion[idx], motion, GRADIENT_GAIN) > 0.1) active++;
+    }
+    return active;
+}
+
+function updateColorBright(pool, lo, hi, field) {
+    const { idxs } = pool;
+    const color = field.colorMap;
+    let active = 0;
+    for (let i = lo; i < hi; i++) {
+        const idx = idxs[i];
+        if (integrateScout(pool, field, i, idx, color[idx], color, GRADIENT_GAIN) > 0.1) active++;
+    }
+    return active;
+}
+
+function updateColorDark(pool, lo, hi, field) {
+    const { idxs } = pool;
+    const color = field.colorMap;
+    let active = 0;
+    for (let i = lo; i < hi; i++) {
+        const idx = idxs[i];
+        if (integrateScout(pool, field, i, idx, 1.0 - color[idx], color, GRADIENT_GAIN) > 0.1) active++;
+    }
+    return active;
+}
+
+function updateTextureHigh(pool, lo, hi, field) {
+    const { idxs } = pool;
+    const texture = field.textureMap;
+    let active = 0;
+    for (let i = lo; i < hi; i++) {
+        const idx = idxs[i];
+        if (integrateScout(pool, field, i, idx, texture[idx], field.colorMap, GRADIENT_GAIN) > 0.1) active++;
+    }
+    return active;
+}
+
+function updateTextureLow(pool, lo, hi, field) {
+    const { idxs } = pool;
+    const texture = field.textureMap;
+    let active = 0;
+    for (let i = lo; i < hi; i++) {
+        const idx = idxs[i];
+        const stimulus = Math.max(0, 0.5 - texture[idx]);
+        if (integrateScout(pool, field, i, idx, stimulus, field.colorMap, GRADIENT_GAIN) > 0.1) active++;
+    }
+    return active;
+}
+
+// Kernel for each scout type, indexed by SCOUT_TYPES value
+const SCOUT_KERNELS = [
+    updateEdgeVertical,   // EDGE_VERTICAL
+    updateEdgeHorizontal, // EDGE_HORIZONTAL
+    updateEdgeDiagonal1,  // EDGE_DIAGONAL_1
+    updateEdgeDiagonal2,  // EDGE_DIAGONAL_2
+    updateMotion,         // MOTION_UP
+    updateMotion,         // MOTION_DOWN
+    updateMotion,         // MOTION_LEFT
+    updateMotion,         // MOTION_RIGHT
+    updateColorBright,    // COLOR_BRIGHT
+    updateColorDark,      // COLOR_DARK
+    updateTextureHigh,    // TEXTURE_HIGH
+    updateTextureLow      // TEXTURE_LOW
+];
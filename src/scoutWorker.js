@@ -0,0 +1,21 @@
+/* eslint-disable no-restricted-globals */
+// Scout worker: updates one shard of the scout population in place and scatters
+// its activations into the shared attractor accumulator. The pool and the feature
+// maps arrive once as views of SharedArrayBuffers, so each frame only a tiny
+// {frame, lo, hi} message crosses the thread boundary.
+import { scatterActivations, updateScoutRange } from './scoutKernels';
+
+let pool = null;
+let field = null;
+
+self.onmessage = ({ data }) => {
+    if (data.type === 'init') {
+        pool = data.pool;
+        field = data.field;
+        return;
+    }
+    
+    const active = updateScoutRange(pool, field, data.lo, data.hi);
+    scatterActivations(pool, data.lo, data.hi, field, true);
+    self.postMessage({ frame: data.frame, active });
+};
@@ -0,0 +1,11 @@
+// Picked up by the react-scripts dev server. SharedArrayBuffer, and with it the
+// scout worker pool, is only exposed to cross-origin isolated pages, so serve
+// everything with the COOP/COEP headers that turn isolation on.
+// GitHub Pages cannot set headers; see public/coi-serviceworker.js for that case.
+module.exports = function (app) {
+    app.use((req, res, next) => {
+        res.setHeader('Cross-Origin-Opener-Policy', 'same-origin');
+        res.setHeader('Cross-Origin-Embedder-Policy', 'require-corp');
+        next();
+    });
+};